@@ -1,17 +1,28 @@
 import os
 import json
+import functools
 import logging
 import time
 import re
+import sqlite3
+import threading
 import requests
-import pandas as pd
-from datetime import datetime
-from typing import List, Dict, Set
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from operator import itemgetter
+from typing import List, Dict, Set, Iterable, Iterator, Optional, Tuple
 
+import httplib2
 from dotenv import load_dotenv
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from google.auth.exceptions import RefreshError
+from google.auth.transport.requests import Request
 from google.oauth2 import service_account
 from google.oauth2.credentials import Credentials
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ロギングの設定
 logging.basicConfig(
@@ -26,25 +37,203 @@ logger = logging.getLogger(__name__)
 # Google Sheets APIのスコープ
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 
+# YouTube Data APIのエンドポイント
+YOUTUBE_API_URL = 'https://www.googleapis.com/youtube/v3'
+
+# YouTube APIへの同時リクエスト数（人気動画取得とチャンネル詳細取得で共有する上限）
+MAX_WORKERS = 16
+
+# HTTPリクエストのタイムアウト（秒）
+REQUEST_TIMEOUT = 30
+
+# YouTube APIの読み取りリクエストの上限（1分あたり）
+YOUTUBE_REQUESTS_PER_MINUTE = 300
+# トークンバケットの容量（全ワーカーが同時に1件ずつ開始できる分だけ）と毎秒の補充数。
+# 任意の60秒間のリクエスト数は 容量 + 補充数 × 60 = YOUTUBE_REQUESTS_PER_MINUTE 以下に収まる
+YOUTUBE_RATE_CAPACITY = MAX_WORKERS
+YOUTUBE_RATE_PER_SEC = (YOUTUBE_REQUESTS_PER_MINUTE - YOUTUBE_RATE_CAPACITY) / 60
+
+# YouTube Data APIの1日のクォータ制限（videos.list / channels.list は1回あたり1ユニット）
+YOUTUBE_DAILY_QUOTA = 10000
+
+# channels.listで一度に指定できるチャンネルIDの上限
+CHANNEL_BATCH_SIZE = 50
+
+# スプレッドシートへ書き込む前にメモリ上に溜めておく最大行数
+WRITE_BUFFER_ROWS = 500
+
+# 1回のvalues.appendで送る最大行数（リクエストボディのサイズ上限対策）
+APPEND_CHUNK_ROWS = 1000
+
+# 403のうちリトライ対象とするエラー理由（レート制限のみ。キー不正や1日のクォータ超過は再試行しても成功しない）
+RETRYABLE_403_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+MAX_RETRIES = 5
+
+# 書き込み済みチャンネルIDのローカルキャッシュ（SQLite）
+CHANNEL_CACHE_PATH = 'cache/channel_ids.sqlite3'
+
+# アクセストークンの残り有効期間がこの秒数を下回ったら事前に更新する
+TOKEN_REFRESH_MARGIN = 600
+
+# スプレッドシートの列（チャンネル情報のキー）と日本語ヘッダー
+_HEADER_KEYS = ('channel_id', 'title', 'description', 'email', 'subscriber_count', 'view_count', 'video_count', 'fetched_at')
+_HEADER_LABELS = ('チャンネルID', 'チャンネル名称', '説明', 'メールアドレス', '登録者数', '視聴数', '動画数', 'チャンネル取得日')
+_ROW_GETTER = itemgetter(*_HEADER_KEYS)
+
+# メールアドレスのパターン（モジュール読み込み時に一度だけコンパイル）
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', re.ASCII)
+
 def extract_email(description: str) -> str:
     """説明文からメールアドレスを抽出"""
-    if not description:
+    # '@' を含まない説明文（大半を占める）は正規表現を実行せずに判定する
+    if not description or '@' not in description:
         return "取得失敗"
-    
-    # メールアドレスのパターン
-    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    match = re.search(email_pattern, description)
-    
-    if match:
-        return match.group(0)
-    return "取得失敗"
+
+    match = _EMAIL_RE.search(description)
+    return match.group(0) if match else "取得失敗"
+
+class RateLimiter:
+    """トークンバケット方式のレートリミッター（複数スレッドから共有可能）
+
+    トークンが残っていればすぐに通過し、バケットが空の場合のみ補充されるまで待機する。
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: int):
+        self.rate_per_sec = rate_per_sec
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquired_count = 0  # これまでに通過したリクエスト数
+
+    def acquire(self):
+        """トークンを1つ消費する（空の場合は補充されるまで待機）"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_sec)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self.acquired_count += 1
+                    return
+                wait = (1 - self._tokens) / self.rate_per_sec
+            time.sleep(wait)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+def _error_reason(response: requests.Response) -> str:
+    """Google APIのエラーレスポンスから error.errors[0].reason を取り出す（取得できなければ空文字列）"""
+    try:
+        return response.json()['error']['errors'][0]['reason']
+    except (ValueError, KeyError, IndexError, TypeError):
+        return ''
+
+def _is_retryable(response: requests.Response) -> bool:
+    """429・5xx、またはレート制限による403の場合のみ再試行の対象とする"""
+    status = response.status_code
+    if status == 429 or status >= 500:
+        return True
+    return status == 403 and _error_reason(response) in RETRYABLE_403_REASONS
+
+def get_with_retry(session: requests.Session, url: str, params: Dict, limiter: RateLimiter) -> Dict:
+    """GETリクエストを実行してJSONを返し、レート制限（403/429）と5xxの場合のみ指数バックオフで再試行"""
+    for attempt in range(MAX_RETRIES + 1):
+        with limiter:  # 再試行も1リクエストとして数える
+            response = session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+        if response.ok:
+            return response.json()
+
+        if attempt == MAX_RETRIES or not _is_retryable(response):
+            response.raise_for_status()
+        wait = min(2 ** attempt, 60)
+        logger.warning(f"APIリクエストが失敗しました（ステータス: {response.status_code}）。{wait}秒後に再試行します。({attempt + 1}/{MAX_RETRIES})")
+        time.sleep(wait)
+
+@functools.lru_cache(maxsize=1)
+def _read_category_ids(path: str) -> Tuple[Dict, ...]:
+    """カテゴリIDの設定ファイルを読み込む（常駐プロセスで繰り返し実行されても読み込みは1回）"""
+    # 例外はキャッシュされないため、読み込みに失敗した場合は次回呼び出し時に再試行される
+    with open(path, 'rb') as f:
+        return tuple(json.loads(f.read())['categories'])
+
+class ChannelIdCache:
+    """スプレッドシートに書き込み済みのチャンネルIDをローカルのSQLiteにキャッシュする
+
+    シートは追記のみで運用されるため、同期済みの行数と最終行のチャンネルIDを記録しておけば、
+    次回起動時はそれ以降に追記された行だけをシートから読み込めばよい。
+    """
+
+    def __init__(self, path: str, sheet_key: str):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._sheet_key = sheet_key
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS channels ("
+                "sheet_key TEXT NOT NULL, channel_id TEXT NOT NULL, "
+                "PRIMARY KEY (sheet_key, channel_id)) WITHOUT ROWID")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state ("
+                "sheet_key TEXT PRIMARY KEY, row_count INTEGER NOT NULL, last_id TEXT NOT NULL)")
+
+    def load(self) -> Tuple[int, str, Set[str]]:
+        """(同期済みの行数, 最終行のチャンネルID, チャンネルIDの集合) を返す（未同期なら行数は0）"""
+        row = self._conn.execute(
+            "SELECT row_count, last_id FROM sync_state WHERE sheet_key = ?", (self._sheet_key,)).fetchone()
+        if row is None:
+            return 0, '', set()
+        cursor = self._conn.execute("SELECT channel_id FROM channels WHERE sheet_key = ?", (self._sheet_key,))
+        return row[0], row[1], {channel_id for (channel_id,) in cursor}
+
+    def add(self, channel_ids: Iterable[str], row_count: int, last_id: str, replace: bool = False):
+        """チャンネルIDを追加し、同期済みの行数と最終行を更新する（replace=True の場合は全件を置き換える）"""
+        # 同じトランザクションで更新するため、途中で失敗しても同期状態とID一覧がずれることはない
+        with self._conn:
+            if replace:
+                self._conn.execute("DELETE FROM channels WHERE sheet_key = ?", (self._sheet_key,))
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO channels (sheet_key, channel_id) VALUES (?, ?)",
+                ((self._sheet_key, channel_id) for channel_id in channel_ids))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (sheet_key, row_count, last_id) VALUES (?, ?, ?)",
+                (self._sheet_key, row_count, last_id))
 
 class YouTubeChannelCollector:
     def __init__(self, spreadsheet_id: str, sheet_name: str):
-        self.youtube = build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
+        # YouTube Data APIはRESTエンドポイントを直接呼び出し、スレッド間でコネクションプールを共有する
+        self._http = requests.Session()
+        self._http.mount('https://', HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS))
+        # Slack Webhookも同じセッションで送信し、429/5xxの場合はRetry-Afterに従って再送する
+        self._http.mount('https://hooks.slack.com/', HTTPAdapter(max_retries=Retry(
+            total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['POST'], raise_on_status=False)))
+        self.limiter = RateLimiter(YOUTUBE_RATE_PER_SEC, YOUTUBE_RATE_CAPACITY)
+        self._fetched_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')  # run() の開始時に更新
+        self._fetched_count = 0  # 人気動画から取得したチャンネル数（_iter_channel_details で集計）
+        self._email_count = 0  # メールアドレスを抽出できたチャンネル数（チャンネル情報の作成時に集計）
+        self._email_count_lock = threading.Lock()
         self.sheets_service = self._authenticate_google_sheets()
+        # シートの使用行数（ヘッダー含む）。_load_existing_channel_ids で初期化し、追記のたびに加算する。
+        # 読み込みに失敗して行数が不明な場合は None（既存シートの途中にヘッダーを書き込まないため）
+        self._row_count: Optional[int] = 0
+        self._cache = self._open_channel_cache(spreadsheet_id, sheet_name)
         self.existing_channels = self._load_existing_channel_ids(spreadsheet_id, sheet_name)
-        
+
+    def _youtube_get(self, resource: str, params: Dict) -> Dict:
+        """YouTube Data APIのリソース（videos, channels など）を取得"""
+        return get_with_retry(self._http, f'{YOUTUBE_API_URL}/{resource}', {**params, 'key': YOUTUBE_API_KEY}, self.limiter)
+
+    @property
+    def quota_used(self) -> int:
+        """全カテゴリ・全スレッドで共有しているYouTube APIのクォータ使用量"""
+        return self.limiter.acquired_count
+
     def _authenticate_google_sheets(self):
         """Google Sheets APIの認証（環境変数からサービスアカウントキーを読み込み）"""
         try:
@@ -61,7 +250,11 @@ class YouTubeChannelCollector:
                 service_account_dict, scopes=SCOPES
             )
             
-            return build('sheets', 'v4', credentials=credentials)
+            self._credentials = credentials
+
+            # 長寿命のhttplib2.Httpを使い回し、複数回のSheets API呼び出しで接続（TLSセッション）を再利用する
+            authorized_http = AuthorizedHttp(credentials, http=httplib2.Http())
+            return build('sheets', 'v4', http=authorized_http, cache_discovery=False, static_discovery=True)
             
         except json.JSONDecodeError as e:
             logger.error(f"サービスアカウントキーのJSON形式が不正です: {str(e)}")
@@ -70,18 +263,88 @@ class YouTubeChannelCollector:
             logger.error(f"Google Sheets APIの認証に失敗しました: {str(e)}")
             raise
 
+    def _ensure_fresh_credentials(self):
+        """アクセストークンが未取得、または有効期限が近い場合は事前に更新する"""
+        expiry = self._credentials.expiry  # google-authはUTCのnaive datetimeで保持している
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        if expiry is None or (expiry - now).total_seconds() < TOKEN_REFRESH_MARGIN:
+            self._credentials.refresh(Request())
+
+    def _execute_sheets(self, request):
+        """Sheets APIリクエストを実行し、認証エラーの場合はトークンを更新して1回だけ再試行"""
+        self._ensure_fresh_credentials()
+        try:
+            return request.execute()
+        except (RefreshError, HttpError) as e:
+            if isinstance(e, HttpError) and e.resp.status != 401:
+                raise
+            logger.warning(f"Google Sheets APIの認証エラーが発生したため、トークンを更新して再試行します: {str(e)}")
+            self._credentials.refresh(Request())
+            return request.execute()
+
+    def _open_channel_cache(self, spreadsheet_id: str, sheet_name: str):
+        """チャンネルIDのローカルキャッシュを開く（開けない場合はキャッシュなしで動作する）"""
+        try:
+            return ChannelIdCache(CHANNEL_CACHE_PATH, f'{spreadsheet_id}!{sheet_name}')
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"チャンネルIDのキャッシュを開けないため、キャッシュなしで実行します: {str(e)}")
+            return None
+
+    def _update_channel_cache(self, channel_ids: List[str], last_id: str, replace: bool = False):
+        """シートに書き込んだ（読み込んだ）チャンネルIDをキャッシュに反映する"""
+        if self._cache is None:
+            return
+        try:
+            self._cache.add(channel_ids, self._row_count, last_id, replace=replace)
+        except sqlite3.Error as e:
+            # 同期状態は更新されないため、次回起動時に未反映の行はシートから読み直される
+            logger.warning(f"チャンネルIDのキャッシュの更新に失敗しました: {str(e)}")
+
+    def _read_column(self, spreadsheet_id: str, range_name: str) -> List[str]:
+        """指定範囲の1列目を1つの配列として取得する"""
+        # 列単位で取得すると列全体が1つの配列で返るため、行ごとの展開が不要になる
+        result = self._execute_sheets(self.sheets_service.spreadsheets().values().get(
+            spreadsheetId=spreadsheet_id, range=range_name,
+            majorDimension='COLUMNS', fields='values'))
+        return result.get('values', [[]])[0]
+
     def _load_existing_channel_ids(self, spreadsheet_id: str, sheet_name: str) -> Set[str]:
-        """スプレッドシートから既存のチャンネルIDを読み込む"""
+        """既存のチャンネルIDを読み込む（シートの使用行数もあわせて記録）
+
+        ローカルキャッシュがあれば、前回同期した最終行以降だけをシートから読み込む。
+        """
         try:
-            range_name = f'{sheet_name}!A2:A'  # A2から最終行まで
-            result = self.sheets_service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id, range=range_name).execute()
-            values = result.get('values', [])
-            if not values:
+            cached_rows, last_id, existing_ids = self._cache.load() if self._cache else (0, '', set())
+            if cached_rows > 1:
+                # 前回同期した最終行から読み込み、その行が変わっていなければ追記分だけを反映する
+                try:
+                    column = self._read_column(spreadsheet_id, f'{sheet_name}!A{cached_rows}:A')
+                except Exception as e:
+                    # 一時的なエラーで既存IDを失うと全件が重複して追記されるため、キャッシュの内容で続行する
+                    logger.warning(f"スプレッドシートからの追記分の読み込みに失敗したため、キャッシュの{len(existing_ids)}件で続行します: {str(e)}")
+                    self._row_count = cached_rows
+                    return existing_ids
+                if column and column[0] == last_id:
+                    new_ids = [channel_id for channel_id in column[1:] if channel_id]  # 途中の空セルは空文字列で返る
+                    self._row_count = cached_rows + len(column) - 1
+                    if new_ids:
+                        existing_ids.update(new_ids)
+                        self._update_channel_cache(new_ids, column[-1])
+                    logger.info(f"{len(existing_ids)}件の既存チャンネルIDを読み込みました（うち{len(new_ids)}件をスプレッドシートから取得）。")
+                    return existing_ids
+                logger.warning("チャンネルIDのキャッシュとスプレッドシートの内容が一致しないため、全件を読み込み直します。")
+
+            column = self._read_column(spreadsheet_id, f'{sheet_name}!A1:A')  # ヘッダー行（A1）から最終行まで
+            self._row_count = len(column)
+            if len(column) <= 1:
+                # シートが空になっている場合は、古いIDが既存扱いで残らないようキャッシュも空にする
+                self._update_channel_cache([], column[-1] if column else '', replace=True)
                 logger.info("スプレッドシートに既存のチャンネルIDは見つかりませんでした。")
                 return set()
             
-            existing_ids = {row[0] for row in values if row}
+            existing_ids = set(column[1:])
+            existing_ids.discard('')  # 途中の空セルは空文字列で返る
+            self._update_channel_cache(existing_ids, column[-1], replace=True)
             logger.info(f"{len(existing_ids)}件の既存チャンネルIDをスプレッドシートから読み込みました。")
             return existing_ids
         except Exception as e:
@@ -90,13 +353,13 @@ class YouTubeChannelCollector:
                 logger.warning(f"シート '{sheet_name}' が存在しないか、範囲の指定に問題があります。新規作成として扱います。")
             else:
                 logger.error(f"スプレッドシートからのデータ読み込みに失敗しました: {str(e)}")
+            self._row_count = None
             return set()
 
     def _load_category_ids(self) -> List[Dict]:
         """カテゴリIDの設定を読み込み"""
         try:
-            with open('config/category_ids.json', 'r', encoding='utf-8') as f:
-                return json.load(f)['categories']
+            return list(_read_category_ids('config/category_ids.json'))
         except FileNotFoundError:
             logger.error("config/category_ids.json が見つかりません。")
             return []
@@ -110,34 +373,29 @@ class YouTubeChannelCollector:
             all_channel_ids = set()
             new_channel_ids = set()
             next_page_token = None
-            daily_limit = 10000  # YouTube Data APIの1日のクォータ制限
-            total_quota = 0
             
             while True:
-                request = self.youtube.videos().list(
-                    part='snippet',
-                    chart='mostPopular',
-                    regionCode='JP',
-                    videoCategoryId=category_id,
-                    maxResults=50,
-                    pageToken=next_page_token
-                )
-                response = request.execute()
-                
-                total_quota += 1
+                # 失敗時もnext_page_tokenは保持されるため、同じページから再試行される
+                response = self._youtube_get('videos', {
+                    'part': 'snippet',
+                    'chart': 'mostPopular',
+                    'regionCode': 'JP',
+                    'videoCategoryId': category_id,
+                    'maxResults': 50,
+                    'pageToken': next_page_token,
+                    'fields': 'nextPageToken,items/snippet/channelId'  # 使用するフィールドのみ取得
+                })
                 
-                for item in response.get('items', []):
-                    channel_id = item['snippet']['channelId']
-                    all_channel_ids.add(channel_id)
-                    if channel_id not in self.existing_channels:
-                        new_channel_ids.add(channel_id)
+                page_ids = {item['snippet']['channelId'] for item in response.get('items', [])}
+                all_channel_ids |= page_ids
+                added_ids = page_ids - self.existing_channels - new_channel_ids
+                new_channel_ids |= added_ids
                 
                 next_page_token = response.get('nextPageToken')
                 
-                if not next_page_token or total_quota >= daily_limit:
+                # ページ内に新規チャンネルが1件もなければ、より順位の低い以降のページも既存である可能性が高いため打ち切る
+                if not next_page_token or not added_ids or self.quota_used >= YOUTUBE_DAILY_QUOTA:
                     break
-                
-                time.sleep(1)
             
             fetched_count = len(all_channel_ids)
             logger.info(f"カテゴリID[{category_id}]で{fetched_count}件のユニークチャンネルを発見し、うち{len(new_channel_ids)}件が新規でした。")
@@ -146,114 +404,139 @@ class YouTubeChannelCollector:
             logger.error(f"動画の取得に失敗しました。カテゴリID[{category_id}]: {str(e)}")
             return 0, []
     
-    def get_channel_details(self, channel_ids: List[str]) -> List[Dict]:
-        """チャンネル詳細情報を取得"""
-        if not channel_ids:
-            return []
-        
+    def _iter_popular_videos(self, categories: List[Dict], executor: ThreadPoolExecutor) -> Iterator[Tuple[Dict, int, List[str]]]:
+        """カテゴリごとの人気動画取得を並列に実行し、完了したものから (カテゴリ, 取得数, 新規IDリスト) を返す"""
+        futures = {executor.submit(self.get_popular_videos, category['id']): category for category in categories}
+        for future in as_completed(futures):
+            fetched_count, new_channel_ids = future.result()
+            yield futures[future], fetched_count, new_channel_ids
+
+    def _iter_channel_details(self, categories: List[Dict]) -> Iterator[List[Dict]]:
+        """人気動画の取得とチャンネル詳細の取得をパイプラインで実行し、取得できたバッチから順に返す
+
+        カテゴリをまたいで重複を除いた新規チャンネルIDが50件たまった時点で、残りのカテゴリを
+        待たずにチャンネル詳細の取得を開始する。取得したチャンネル数は self._fetched_count に加算する。
+        """
+        queued_ids: Set[str] = set()  # カテゴリをまたいで重複したチャンネルIDを除外するため
+        pending_ids: List[str] = []
+        detail_futures = set()
+        batch_no = 0
+
+        # 人気動画取得とチャンネル詳細取得を1つのスレッドプールで実行し、
+        # YouTube APIへの同時リクエスト数を全体で MAX_WORKERS に抑える
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for category, fetched_count, new_channel_ids in self._iter_popular_videos(categories, executor):
+                logger.info(f"処理中 カテゴリ: {category['name']} (ID: {category['id']})")
+                self._fetched_count += fetched_count
+
+                unique_ids = set(new_channel_ids) - queued_ids
+                queued_ids |= unique_ids
+                pending_ids.extend(unique_ids)
+
+                while len(pending_ids) >= CHANNEL_BATCH_SIZE:
+                    batch_no += 1
+                    batch = pending_ids[:CHANNEL_BATCH_SIZE]
+                    del pending_ids[:CHANNEL_BATCH_SIZE]
+                    detail_futures.add(executor.submit(self._fetch_channel_batch, batch_no, batch))
+
+                # 完了済みのバッチは随時返し、結果をメモリに溜め込まない
+                done = {future for future in detail_futures if future.done()}
+                detail_futures -= done
+                for future in done:
+                    yield future.result()
+
+            if pending_ids:
+                batch_no += 1
+                detail_futures.add(executor.submit(self._fetch_channel_batch, batch_no, pending_ids))
+
+            for future in as_completed(detail_futures):
+                yield future.result()
+
+    def _fetch_channel_batch(self, batch_no: int, batch: List[str]) -> List[Dict]:
+        """1バッチ分（最大50件）のチャンネル詳細情報を取得"""
         channels = []
-        # チャンネルIDを50個ずつのバッチに分割
-        batch_size = 50
-        for i in range(0, len(channel_ids), batch_size):
-            batch = channel_ids[i:i + batch_size]
-            try:
-                request = self.youtube.channels().list(
-                    part='snippet,statistics',
-                    id=','.join(batch),
-                    maxResults=batch_size
-                )
-                response = request.execute()
-                
-                for item in response.get('items', []):
-                    description = item['snippet'].get('description', '')
-                    subscriber_count = int(item['statistics'].get('subscriberCount', 0))
-                    if subscriber_count < MIN_SUBSCRIBER_COUNT:
-                        continue  # 10万未満は除外
-                    channel = {
-                        'channel_id': item['id'],
-                        'title': item['snippet']['title'],
-                        'description': description,
-                        'email': extract_email(description),
-                        'subscriber_count': subscriber_count,
-                        'view_count': int(item['statistics'].get('viewCount', 0)),
-                        'video_count': int(item['statistics'].get('videoCount', 0)),
-                        'fetched_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S') # スプレッドシート用に文字列化
-                    }
-                    channels.append(channel)
-                
-                # API制限を考慮して少し待機
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"チャンネル詳細の取得に失敗しました。バッチ {i//batch_size + 1}: {str(e)}")
-                continue
-        
+        email_count = 0
+        try:
+            response = self._youtube_get('channels', {
+                'part': 'snippet,statistics',
+                'id': ','.join(batch),
+                'maxResults': 50,
+                'fields': 'items(id,snippet(title,description),statistics(subscriberCount,viewCount,videoCount))'
+            })
+
+            fetched_at = self._fetched_at  # スプレッドシート用に文字列化済み
+            for item in response.get('items', []):
+                snippet = item['snippet']
+                stats = item['statistics']
+                subscriber_count = int(stats.get('subscriberCount', '0'))
+                if subscriber_count < MIN_SUBSCRIBER_COUNT:
+                    continue  # 10万未満は除外
+                description = snippet.get('description', '')
+                email = extract_email(description)
+                if email != "取得失敗":
+                    email_count += 1
+                channel = {
+                    'channel_id': item['id'],
+                    'title': snippet['title'],
+                    'description': description,
+                    'email': email,
+                    'subscriber_count': subscriber_count,
+                    'view_count': int(stats.get('viewCount', '0')),
+                    'video_count': int(stats.get('videoCount', '0')),
+                    'fetched_at': fetched_at
+                }
+                channels.append(channel)
+        except Exception as e:
+            logger.error(f"チャンネル詳細の取得に失敗しました。バッチ {batch_no}: {str(e)}")
+
+        # 複数のワーカースレッドから更新されるため、ロックを取って加算する
+        with self._email_count_lock:
+            self._email_count += email_count
         return channels
-    
+
     def write_to_spreadsheet(self, data: List[Dict], spreadsheet_id: str, sheet_name: str):
         """データをGoogleスプレッドシートに追記する"""
         if not data:
             logger.info("書き込むデータがありません。")
             return
 
-        # 日本語ヘッダーとキーのマッピング
-        header_map = {
-            'channel_id': 'チャンネルID',
-            'title': 'チャンネル名称',
-            'description': '説明',
-            'email': 'メールアドレス',
-            'subscriber_count': '登録者数',
-            'view_count': '視聴数',
-            'video_count': '動画数',
-            'fetched_at': 'チャンネル取得日'
-        }
-
-        # 書き込むデータを作成
-        values = []
-        for d in data:
-            row = [d.get(key, '') for key in header_map.keys()]
-            values.append(row)
+        # リクエストボディが大きくなりすぎないよう、APPEND_CHUNK_ROWS 行ずつ追記する
+        for start in range(0, len(data), APPEND_CHUNK_ROWS):
+            chunk = data[start:start + APPEND_CHUNK_ROWS]
+            # 書き込むデータを作成（チャンネル情報は常に全キーを持つため itemgetter で一括取得）
+            values = [list(_ROW_GETTER(d)) for d in chunk]
 
-        try:
-            # 最終行を取得して、その次の行から追記する
-            range_name = f'{sheet_name}!A:A'
-            result = self.sheets_service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id, range=range_name).execute()
-            last_row = len(result.get('values', []))
-            
-            # ヘッダーが存在しない場合（初回書き込み）はヘッダーを書き込む
-            if last_row == 0:
-                header_row = [list(header_map.values())]
-                self.sheets_service.spreadsheets().values().update(
+            # 読み込みでシートが空と確認できた場合（初回書き込み）のみ、データの先頭にヘッダーを付けて一緒に書き込む
+            if self._row_count == 0:
+                values.insert(0, list(_HEADER_LABELS))
+
+            try:
+                # 追記先の最終行はSheets API側で判定されるため、A1を起点に1回のappendで書き込む
+                body = {
+                    'values': values
+                }
+                result = self._execute_sheets(self.sheets_service.spreadsheets().values().append(
                     spreadsheetId=spreadsheet_id,
                     range=f'{sheet_name}!A1',
                     valueInputOption='RAW',
-                    body={'values': header_row}
-                ).execute()
-                last_row = 1 # ヘッダー分を考慮
-
-            # データを追記
-            body = {
-                'values': values
-            }
-            result = self.sheets_service.spreadsheets().values().append(
-                spreadsheetId=spreadsheet_id,
-                range=f'{sheet_name}!A{last_row + 1}',
-                valueInputOption='RAW',
-                body=body,
-                insertDataOption='INSERT_ROWS'
-            ).execute()
-            
-            logger.info(f"{result.get('updates', {}).get('updatedCells', 0)} セルが更新されました。")
-            logger.info(f"スプレッドシートに {len(values)} 件のデータを追記しました: {spreadsheet_id}")
+                    body=body,
+                    insertDataOption='INSERT_ROWS'
+                ))
+                updates = result.get('updates', {})
+                # 行数が不明な場合はキャッシュの同期状態を進めず、次回起動時にシートから読み直す
+                if self._row_count is not None:
+                    self._row_count += updates.get('updatedRows', len(values))
+                    self._update_channel_cache([d['channel_id'] for d in chunk], chunk[-1]['channel_id'])
 
-        except Exception as e:
-            logger.error(f"スプレッドシートへの書き込みに失敗しました: {str(e)}")
+                logger.info(f"{updates.get('updatedCells', 0)} セルが更新されました。")
+                logger.info(f"スプレッドシートに {len(chunk)} 件のデータを追記しました: {spreadsheet_id}")
 
-    def send_slack_notification(self, fetched_count: int, new_channels: List[Dict]):
+            except Exception as e:
+                logger.error(f"スプレッドシートへの書き込みに失敗しました: {str(e)}")
+                return
+
+    def send_slack_notification(self, fetched_count: int, added_count: int):
         """Slackに実行結果を通知"""
-        added_count = len(new_channels)
-        email_count = sum(1 for c in new_channels if c.get('email') and c['email'] != '取得失敗')
         # 総チャンネル数は、実行前の既存数 + 今回新たに追加された数
         total_count = len(self.existing_channels) + added_count
 
@@ -263,7 +546,7 @@ class YouTubeChannelCollector:
             f"📊 **実行結果**\n"
             f"• 取得チャンネル数: {fetched_count}件\n"
             f"• 新規追加チャンネル数: {added_count}件\n"
-            f"• メールアドレス正常抽出数: {email_count}件\n"
+            f"• メールアドレス正常抽出数: {self._email_count}件\n"
             f"• 総チャンネル数: {total_count}件\n"
             f"• 出力先URL: https://docs.google.com/spreadsheets/d/11DqIAdm9ofnr9Zip8YQP2-yqdK4UOf_DTx_eiuJXVmw/edit?gid=0#gid=0\n"
         )
@@ -271,7 +554,7 @@ class YouTubeChannelCollector:
         payload = {"text": message}
         
         try:
-            response = requests.post(SLACK_WEBHOOK_URL, json=payload, timeout=10)
+            response = self._http.post(SLACK_WEBHOOK_URL, json=payload, timeout=10)
             if response.status_code == 200:
                 logger.info("Slack通知を送信しました。")
             else:
@@ -282,36 +565,38 @@ class YouTubeChannelCollector:
     def run(self, spreadsheet_id: str):
         """メイン処理の実行"""
         logger.info(f"バッチ処理を開始します。")
+        # チャンネル取得日は1回のバッチ実行で共通の時刻を使う
+        self._fetched_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self._fetched_count = 0
+        self._email_count = 0
         
         categories = self._load_category_ids()
-        total_fetched_count = 0
-        all_new_channels = []
-        
-        for category in categories:
-            logger.info(f"処理中 カテゴリ: {category['name']} (ID: {category['id']})")
-            
-            fetched_count, new_channel_ids = self.get_popular_videos(category['id'])
-            total_fetched_count += fetched_count
-            
-            if new_channel_ids:
-                channels: List[Dict] = self.get_channel_details(new_channel_ids)
-                all_new_channels.extend(channels)
-                
-                logger.info(f"{len(channels)} new channels added from category {category['name']}")
-            
-            time.sleep(1)
-        
-        logger.info(f"処理が完了しました。合計取得チャンネル数: {total_fetched_count}, 新規追加対象: {len(all_new_channels)}")
-        
-        if all_new_channels:
-            sheet_name = os.getenv('SHEET_NAME', 'Sheet1')
+        sheet_name = os.getenv('SHEET_NAME', 'Sheet1')
+        added_count = 0
+        buffer: List[Dict] = []
+
+        # 取得したチャンネルは一定件数ごとにスプレッドシートへ書き込み、
+        # メモリ使用量を抑えるとともに途中で異常終了しても取得済みの分を残す
+        for channels in self._iter_channel_details(categories):
+            added_count += len(channels)
+            buffer.extend(channels)
+
+            if len(buffer) >= WRITE_BUFFER_ROWS:
+                logger.info(f"シート '{sheet_name}' にデータを書き込みます")
+                self.write_to_spreadsheet(buffer, spreadsheet_id, sheet_name)
+                buffer = []
+
+        if buffer:
             logger.info(f"シート '{sheet_name}' にデータを書き込みます")
-            self.write_to_spreadsheet(all_new_channels, spreadsheet_id, sheet_name)
-        else:
+            self.write_to_spreadsheet(buffer, spreadsheet_id, sheet_name)
+
+        logger.info(f"処理が完了しました。合計取得チャンネル数: {self._fetched_count}, 新規追加対象: {added_count}, YouTube APIクォータ使用量: {self.quota_used}")
+        
+        if not added_count:
             logger.info("新規チャンネルが取得されなかったため、スプレッドシートへの書き込みはスキップされました。")
 
         logger.info(f"Slack通知処理を開始します。")
-        self.send_slack_notification(total_fetched_count, all_new_channels)
+        self.send_slack_notification(self._fetched_count, added_count)
 
 if __name__ == '__main__':
 